@@ -189,6 +189,7 @@ function searchSolutions(query: string, limit: number = 10): SolutionMatch[] {
   }
 
   const files = findSolutionFiles(solutionsDir);
+  const rootPrefix = getProjectRoot() + '/';
   const matches: SolutionMatch[] = [];
 
   for (const file of files) {
@@ -199,7 +200,7 @@ function searchSolutions(query: string, limit: number = 10): SolutionMatch[] {
 
     if (score > 0) {
       // Make path relative to project root
-      const relativePath = file.replace(getProjectRoot() + '/', '');
+      const relativePath = file.startsWith(rootPrefix) ? file.slice(rootPrefix.length) : file;
       matches.push({
         path: relativePath,
         frontmatter,
@@ -5,7 +5,7 @@
  * Hooks communicate via stdin/stdout JSON.
  */
 
-import { existsSync, mkdirSync, readFileSync, writeFileSync } from 'fs';
+import { existsSync, mkdirSync, readFileSync, statSync, writeFileSync } from 'fs';
 import { join } from 'path';
 import type { Command } from 'commander';
 import { logHookStart, logHookSuccess } from '../lib/trace-store.js';
@@ -71,18 +71,20 @@ export interface PreCompactOutput {
 
 /**
  * Read hook input from stdin (synchronous for hook context).
+ * Raw chunks are collected and decoded once, rather than decoding and
+ * concatenating strings per chunk.
  */
 export async function readHookInput(): Promise<HookInput> {
   return new Promise((resolve, reject) => {
-    let data = '';
-    process.stdin.setEncoding('utf8');
+    const chunks: Buffer[] = [];
 
-    process.stdin.on('data', (chunk) => {
-      data += chunk;
+    process.stdin.on('data', (chunk: Buffer) => {
+      chunks.push(chunk);
     });
 
     process.stdin.on('end', () => {
       try {
+        const data = Buffer.concat(chunks).toString('utf8');
         if (!data.trim()) {
           resolve({});
           return;
@@ -586,20 +588,38 @@ export interface ProjectSettings {
   disabledHooks?: string[];
 }
 
+/**
+ * Parsed settings.json contents keyed by path.
+ * Entries are invalidated by mtime/size, so long-lived processes (TUI, event loop)
+ * and repeated lookups within a hook skip re-reading unchanged settings.
+ */
+const settingsCache = new Map<string, { mtimeMs: number; size: number; settings: ProjectSettings }>();
+
 /**
  * Load project settings from .allhands/settings.json.
  * Returns null if file doesn't exist or is invalid.
+ * Returns a copy so callers can mutate the result freely.
  */
 export function loadProjectSettings(): ProjectSettings | null {
   const settingsPath = join(getProjectDir(), '.allhands', 'settings.json');
-  if (!existsSync(settingsPath)) {
+  const stat = statSync(settingsPath, { throwIfNoEntry: false });
+  if (!stat) {
+    settingsCache.delete(settingsPath);
     return null;
   }
 
+  const cached = settingsCache.get(settingsPath);
+  if (cached && cached.mtimeMs === stat.mtimeMs && cached.size === stat.size) {
+    return structuredClone(cached.settings);
+  }
+
   try {
     const content = readFileSync(settingsPath, 'utf-8');
-    return JSON.parse(content) as ProjectSettings;
+    const settings = JSON.parse(content) as ProjectSettings;
+    settingsCache.set(settingsPath, { mtimeMs: stat.mtimeMs, size: stat.size, settings });
+    return structuredClone(settings);
   } catch {
+    settingsCache.delete(settingsPath);
     return null;
   }
 }
@@ -9,7 +9,7 @@
 
 import { execSync } from 'child_process';
 import type { Command } from 'commander';
-import { existsSync, readFileSync } from 'fs';
+import { closeSync, existsSync, openSync, readFileSync, readSync } from 'fs';
 import { dirname, extname, join, relative } from 'path';
 import { minimatch } from 'minimatch';
 import {
@@ -296,19 +296,40 @@ function validateSkillSpecificRules(
   return errors;
 }
 
+const FRONTMATTER_CHUNK_SIZE = 8 * 1024;
+
+/**
+ * Read just enough of a file to cover its YAML frontmatter.
+ * Reads in 8KB chunks until the closing `---` delimiter is seen (or it is clear the
+ * file has no frontmatter), so long markdown bodies are never loaded.
+ */
+function readFrontmatterHead(filePath: string): string {
+  const fd = openSync(filePath, 'r');
+  try {
+    const chunks: Buffer[] = [];
+    const chunk = Buffer.allocUnsafe(FRONTMATTER_CHUNK_SIZE);
+    let head = '';
+    let bytesRead: number;
+
+    while ((bytesRead = readSync(fd, chunk, 0, chunk.length, null)) > 0) {
+      chunks.push(Buffer.from(chunk.subarray(0, bytesRead)));
+      head = Buffer.concat(chunks).toString('utf-8');
+      if (head.indexOf('\n---\n', 3) !== -1) break;
+      if (head.length >= 4 && !head.startsWith('---\n')) break;
+    }
+
+    return head;
+  } finally {
+    closeSync(fd);
+  }
+}
+
 /**
  * Run schema validation on a file.
  * Delegates to lib/schema.ts for parsing and validation.
  * Returns validation errors or null if valid.
  */
-function runSchemaValidation(filePath: string): ValidationError[] | null {
-  // Detect schema type
-  const schemaType = detectSchemaTypeLocal(filePath);
-  if (!schemaType) {
-    // Not a schema-managed file
-    return null;
-  }
-
+function runSchemaValidation(filePath: string, schemaType: SchemaType): ValidationError[] | null {
   // Load schema (cached in lib)
   const schema = loadSchemaFromLib(schemaType);
   if (!schema) {
@@ -320,7 +341,8 @@ function runSchemaValidation(filePath: string): ValidationError[] | null {
     return null;
   }
 
-  const content = readFileSync(filePath, 'utf-8');
+  // Only the frontmatter is validated, so skip reading the body
+  const content = readFrontmatterHead(filePath);
 
   // Parse frontmatter using lib
   const { frontmatter } = extractFrontmatter(content);
@@ -348,14 +370,11 @@ function runSchemaValidation(filePath: string): ValidationError[] | null {
  * Delegates to lib/schema.ts for parsing and validation.
  * Returns validation errors or null if valid/not schema-managed.
  */
-function runSchemaValidationOnContent(filePath: string, content: string): ValidationError[] | null {
-  // Detect schema type
-  const schemaType = detectSchemaTypeLocal(filePath);
-  if (!schemaType) {
-    // Not a schema-managed file
-    return null;
-  }
-
+function runSchemaValidationOnContent(
+  filePath: string,
+  schemaType: SchemaType,
+  content: string
+): ValidationError[] | null {
   // Load schema (cached in lib)
   const schema = loadSchemaFromLib(schemaType);
   if (!schema) {
@@ -485,10 +504,15 @@ export function validateSchema(input: HookInput): void {
     return allowTool(HOOK_SCHEMA);
   }
 
-  const errors = runSchemaValidation(filePath!);
+  // Detect once up front: most edits are not schema-managed and exit here
+  const schemaType = detectSchemaTypeLocal(filePath!);
+  if (!schemaType) {
+    return allowTool(HOOK_SCHEMA);
+  }
+
+  const errors = runSchemaValidation(filePath!, schemaType);
 
   if (errors && errors.length > 0) {
-    const schemaType = detectSchemaTypeLocal(filePath!) || 'unknown';
     const context = formatSchemaErrors(errors, schemaType);
     blockTool(context, HOOK_SCHEMA);
   }
@@ -509,6 +533,12 @@ export function validateSchemaPre(input: HookInput): void {
     return allowTool(HOOK_SCHEMA_PRE);
   }
 
+  // Detect once up front, before reading the file for Edit reconstruction
+  const schemaType = detectSchemaTypeLocal(filePath);
+  if (!schemaType) {
+    return allowTool(HOOK_SCHEMA_PRE);
+  }
+
   let contentToValidate: string | undefined;
 
   if (toolName === 'Write') {
@@ -543,10 +573,9 @@ export function validateSchemaPre(input: HookInput): void {
     return allowTool(HOOK_SCHEMA_PRE);
   }
 
-  const errors = runSchemaValidationOnContent(filePath, contentToValidate);
+  const errors = runSchemaValidationOnContent(filePath, schemaType, contentToValidate);
 
   if (errors && errors.length > 0) {
-    const schemaType = detectSchemaTypeLocal(filePath) || 'unknown';
     const context = formatSchemaErrors(errors, schemaType);
     denyTool(context, HOOK_SCHEMA_PRE);
   }
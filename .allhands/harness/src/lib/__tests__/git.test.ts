@@ -0,0 +1,86 @@
+/**
+ * readHeadBranch Tests
+ *
+ * Exercises the fork-free HEAD parser against hand-built git directories:
+ * - plain repositories (including lookup from a nested directory)
+ * - linked worktrees whose `.git` is a `gitdir:` file
+ * - detached HEAD, reftable repos and the GIT_DIR bypass (all fall back to git)
+ */
+
+import { describe, it, expect, beforeEach, afterEach } from 'vitest';
+import { mkdirSync, mkdtempSync, rmSync, writeFileSync } from 'fs';
+import { tmpdir } from 'os';
+import { join } from 'path';
+import { readHeadBranch } from '../git.js';
+
+describe('readHeadBranch()', () => {
+  let root: string;
+  let savedGitDir: string | undefined;
+
+  beforeEach(() => {
+    root = mkdtempSync(join(tmpdir(), 'ah-head-'));
+    savedGitDir = process.env.GIT_DIR;
+    delete process.env.GIT_DIR;
+  });
+
+  afterEach(() => {
+    if (savedGitDir === undefined) {
+      delete process.env.GIT_DIR;
+    } else {
+      process.env.GIT_DIR = savedGitDir;
+    }
+    rmSync(root, { recursive: true, force: true });
+  });
+
+  function makeRepo(dir: string, head: string): string {
+    const gitDir = join(dir, '.git');
+    mkdirSync(gitDir, { recursive: true });
+    writeFileSync(join(gitDir, 'HEAD'), head);
+    return gitDir;
+  }
+
+  it('reads the branch of a plain repository', () => {
+    makeRepo(root, 'ref: refs/heads/feature/auth\n');
+    expect(readHeadBranch(root)).toBe('feature/auth');
+  });
+
+  it('walks up from a nested directory to the repository root', () => {
+    makeRepo(root, 'ref: refs/heads/main\n');
+    const nested = join(root, 'src', 'lib');
+    mkdirSync(nested, { recursive: true });
+    expect(readHeadBranch(nested)).toBe('main');
+  });
+
+  it('follows a gitdir file in a linked worktree', () => {
+    const mainGitDir = makeRepo(join(root, 'main'), 'ref: refs/heads/main\n');
+    const worktreeGitDir = join(mainGitDir, 'worktrees', 'wt');
+    mkdirSync(worktreeGitDir, { recursive: true });
+    writeFileSync(join(worktreeGitDir, 'HEAD'), 'ref: refs/heads/feat/worktree\n');
+
+    const worktree = join(root, 'wt');
+    mkdirSync(worktree);
+    writeFileSync(join(worktree, '.git'), 'gitdir: ../main/.git/worktrees/wt\n');
+
+    expect(readHeadBranch(worktree)).toBe('feat/worktree');
+  });
+
+  it('returns null for a detached HEAD', () => {
+    makeRepo(root, '4b825dc642cb6eb9a060e54bf8d69288fbee4904\n');
+    expect(readHeadBranch(root)).toBeNull();
+  });
+
+  it('returns null for reftable repositories', () => {
+    const gitDir = makeRepo(root, 'ref: refs/heads/.invalid\n');
+    expect(readHeadBranch(root)).toBeNull();
+
+    mkdirSync(join(gitDir, 'reftable'));
+    writeFileSync(join(gitDir, 'HEAD'), 'ref: refs/heads/main\n');
+    expect(readHeadBranch(root)).toBeNull();
+  });
+
+  it('returns null when GIT_DIR overrides repository discovery', () => {
+    makeRepo(root, 'ref: refs/heads/main\n');
+    process.env.GIT_DIR = join(root, '.git');
+    expect(readHeadBranch(root)).toBeNull();
+  });
+});
@@ -5,7 +5,8 @@
  */
 
 import { spawnSync } from "child_process";
-import { basename } from "path";
+import { existsSync, readFileSync, statSync } from "fs";
+import { basename, dirname, join, resolve } from "path";
 import { getBaseBranch, getLocalBaseBranch } from '../hooks/shared.js';
 
 // Re-export getBaseBranch and getLocalBaseBranch for consumers
@@ -75,13 +76,74 @@ const PROTECTED_BRANCHES = new Set([
 // Prefixes that indicate direct mode (no planning)
 const DIRECT_MODE_PREFIXES = ["quick/", "curator/"];
 
+// Characters that are not safe in a directory name
+const UNSAFE_DIR_CHARS = /[^a-zA-Z0-9_-]/g;
+
+const HEAD_BRANCH_PREFIX = "ref: refs/heads/";
+
+// Placeholder HEAD target written by reftable repos, where HEAD is not authoritative
+const REFTABLE_HEAD_BRANCH = ".invalid";
+
+/**
+ * Read the checked-out branch straight from HEAD without forking git.
+ * Walks up from `cwd` to the nearest `.git` (a directory, or a `gitdir:` file for
+ * worktrees and submodules). Returns null when HEAD is detached, the repo uses
+ * reftable ref storage, the repo cannot be located, or GIT_DIR overrides
+ * discovery; callers then fall back to git.
+ */
+export function readHeadBranch(cwd: string): string | null {
+  if (process.env.GIT_DIR) {
+    return null;
+  }
+
+  let dir = resolve(cwd);
+  while (true) {
+    const dotGit = join(dir, ".git");
+    const stat = statSync(dotGit, { throwIfNoEntry: false });
+    if (stat) {
+      try {
+        let gitDir = dotGit;
+        if (stat.isFile()) {
+          const match = readFileSync(dotGit, "utf-8").match(/^gitdir:\s*(.+?)\s*$/m);
+          if (!match) {
+            return null;
+          }
+          gitDir = resolve(dir, match[1]);
+        }
+        if (existsSync(join(gitDir, "reftable"))) {
+          return null;
+        }
+        const head = readFileSync(join(gitDir, "HEAD"), "utf-8").trim();
+        if (!head.startsWith(HEAD_BRANCH_PREFIX)) {
+          return null;
+        }
+        const branch = head.slice(HEAD_BRANCH_PREFIX.length);
+        return branch === REFTABLE_HEAD_BRANCH ? null : branch;
+      } catch {
+        return null;
+      }
+    }
+
+    const parent = dirname(dir);
+    if (parent === dir) {
+      return null;
+    }
+    dir = parent;
+  }
+}
+
 /**
  * Get current git branch name.
  * Uses CLAUDE_PROJECT_DIR if available (for hooks), else current directory.
  */
 export function getBranch(): string {
+  const cwd = process.env.CLAUDE_PROJECT_DIR || process.cwd();
+  const headBranch = readHeadBranch(cwd);
+  if (headBranch !== null) {
+    return headBranch;
+  }
+
   try {
-    const cwd = process.env.CLAUDE_PROJECT_DIR || process.cwd();
     const result = spawnSync("git", ["branch", "--show-current"], {
       encoding: "utf-8",
       cwd,
@@ -96,7 +158,7 @@ export function getBranch(): string {
  * Convert branch name to safe directory name (feat/auth -> feat-auth).
  */
 export function sanitizeBranch(branch: string): string {
-  return branch.replace(/[^a-zA-Z0-9_-]/g, "-");
+  return branch.replace(UNSAFE_DIR_CHARS, "-");
 }
 
 /**
@@ -135,14 +197,27 @@ export function getDiff(ref: string): string {
   }
 }
 
+// Resolved project roots keyed by working directory (stable for the process lifetime)
+const projectRootCache = new Map<string, string>();
+
 /**
  * Get the project root directory (where .git is located).
  * Uses CLAUDE_PROJECT_DIR if available (for hooks), else current directory.
+ * Memoized per working directory so repeated lookups don't fork git.
  */
 export function getProjectRoot(): string {
   const cwd = process.env.CLAUDE_PROJECT_DIR || process.cwd();
+  const cached = projectRootCache.get(cwd);
+  if (cached) {
+    return cached;
+  }
+
   const result = gitExec(['rev-parse', '--show-toplevel'], cwd);
-  return result.success ? result.stdout : cwd;
+  if (!result.success) {
+    return cwd;
+  }
+  projectRootCache.set(cwd, result.stdout);
+  return result.stdout;
 }
 
 /**
@@ -93,6 +93,13 @@ const sessions = new Map<string, McpSession>();
 let serverInstance: Server | null = null;
 let cleanupFn: (() => void) | null = null;
 
+/**
+ * Snapshot of the daemon's environment, taken once at startup.
+ * Enumerating process.env is comparatively costly and the daemon never
+ * mutates it, so each spawned server reuses this base.
+ */
+const baseEnv = { ...process.env } as Record<string, string>;
+
 /**
  * Create and connect a new MCP client for a server.
  */
@@ -106,7 +113,7 @@ async function createClient(config: McpServerConfig): Promise<{ client: Client;
   const transport = new StdioClientTransport({
     command: config.command,
     args: config.args,
-    env: { ...process.env, ...env } as Record<string, string>,
+    env: { ...baseEnv, ...env },
     stderr: 'pipe',
   });
 
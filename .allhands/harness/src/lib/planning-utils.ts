@@ -7,18 +7,12 @@
  * - Current git branch determines which spec is "current"
  */
 
-import { existsSync, readdirSync, readFileSync } from 'fs';
-import { join, resolve } from 'path';
+import { existsSync, readFileSync } from 'fs';
+import { resolve } from 'path';
 import { parse as parseYaml } from 'yaml';
-import { getGitRoot, getCurrentBranch, sanitizeBranchForDir } from './planning.js';
+import { getGitRoot, getCurrentBranch, sanitizeBranchForDir, scanPlanningStatuses } from './planning.js';
 import { findSpecByBranch, type SpecFile } from './specs.js';
 
-interface StatusFile {
-  name: string;
-  spec: string;
-  stage: string;
-}
-
 /**
  * Extract spec name from spec file frontmatter.
  */
@@ -39,44 +33,31 @@ export function extractSpecNameFromFile(specPath: string): string | null {
   }
 }
 
+/**
+ * Strip a leading prefix without scanning the rest of the string.
+ * Unlike String.replace, only an anchored match is removed.
+ */
+function removePrefix(value: string, prefix: string): string {
+  return value.startsWith(prefix) ? value.slice(prefix.length) : value;
+}
+
 /**
  * Find spec by spec file path.
  * Returns the planning directory key if found.
  */
 export function findSpecForPath(specPath: string, cwd?: string): string | null {
   const workDir = cwd || process.cwd();
-  const gitRoot = getGitRoot(workDir);
-  const planningRoot = join(gitRoot, '.planning');
-
-  if (!existsSync(planningRoot)) {
-    return null;
-  }
+  const rootPrefix = getGitRoot(workDir) + '/';
 
   // Normalize the spec path for comparison
   const normalizedSpecPath = resolve(workDir, specPath);
-  const relativeSpecPath = normalizedSpecPath.replace(gitRoot + '/', '');
-
-  const entries = readdirSync(planningRoot, { withFileTypes: true });
-
-  for (const entry of entries) {
-    // Skip non-directories and hidden files
-    if (!entry.isDirectory() || entry.name.startsWith('.')) continue;
-
-    const statusPath = join(planningRoot, entry.name, 'status.yaml');
-    if (!existsSync(statusPath)) continue;
+  const relativeSpecPath = removePrefix(normalizedSpecPath, rootPrefix);
 
-    try {
-      const content = readFileSync(statusPath, 'utf-8');
-      const status = parseYaml(content) as StatusFile;
-
-      // Compare spec paths (handle both absolute and relative)
-      const statusSpecPath = status.spec?.replace(gitRoot + '/', '');
-      if (statusSpecPath === relativeSpecPath || status.spec === specPath) {
-        return entry.name; // Return the planning directory key
-      }
-    } catch {
-      // Skip malformed status files
-      continue;
+  for (const { key, status } of scanPlanningStatuses(workDir)) {
+    // Compare spec paths (handle both absolute and relative)
+    const statusSpecPath = status.spec && removePrefix(status.spec, rootPrefix);
+    if (statusSpecPath === relativeSpecPath || status.spec === specPath) {
+      return key; // Return the planning directory key
     }
   }
 
@@ -100,50 +81,32 @@ export interface SpecLink {
  * List all planning directories with their spec associations.
  */
 export function listAllSpecs(cwd?: string): SpecLink[] {
-  const workDir = cwd || process.cwd();
-  const gitRoot = getGitRoot(workDir);
-  const planningRoot = join(gitRoot, '.planning');
-
-  if (!existsSync(planningRoot)) {
+  const statuses = scanPlanningStatuses(cwd);
+  if (statuses.length === 0) {
     return [];
   }
 
   const currentBranch = getCurrentBranch(cwd);
   const currentKey = sanitizeBranchForDir(currentBranch);
-  const entries = readdirSync(planningRoot, { withFileTypes: true });
   const specs: SpecLink[] = [];
 
-  for (const entry of entries) {
-    // Skip non-directories and hidden files
-    if (!entry.isDirectory() || entry.name.startsWith('.')) continue;
-
-    const statusPath = join(planningRoot, entry.name, 'status.yaml');
-    if (!existsSync(statusPath)) continue;
-
-    try {
-      const content = readFileSync(statusPath, 'utf-8');
-      const status = parseYaml(content) as StatusFile;
-
-      // Try to find the associated spec
-      // The key should match the sanitized version of a spec's branch field
-      // This is a best-effort lookup - the spec may not exist
-      let associatedSpec: SpecFile | undefined;
-
-      // If the key looks like a sanitized branch, try to find the spec
-      // by checking all specs for one whose sanitized branch matches
-      // For now, we just mark isCurrent based on matching keys
-
-      specs.push({
-        key: entry.name,
-        specFile: status.spec,
-        stage: status.stage,
-        isCurrent: entry.name === currentKey,
-        spec: associatedSpec,
-      });
-    } catch {
-      // Skip malformed status files
-      continue;
-    }
+  for (const { key, status } of statuses) {
+    // Try to find the associated spec
+    // The key should match the sanitized version of a spec's branch field
+    // This is a best-effort lookup - the spec may not exist
+    let associatedSpec: SpecFile | undefined;
+
+    // If the key looks like a sanitized branch, try to find the spec
+    // by checking all specs for one whose sanitized branch matches
+    // For now, we just mark isCurrent based on matching keys
+
+    specs.push({
+      key,
+      specFile: status.spec,
+      stage: status.stage,
+      isCurrent: key === currentKey,
+      spec: associatedSpec,
+    });
   }
 
   return specs;
@@ -13,10 +13,10 @@
  */
 
 import { execSync } from 'child_process';
-import { existsSync, mkdirSync, readdirSync, readFileSync, unlinkSync, writeFileSync } from 'fs';
+import { existsSync, mkdirSync, readdirSync, readFileSync, statSync, unlinkSync, writeFileSync, type Dirent } from 'fs';
 import { join } from 'path';
 import { parse as parseYaml, stringify as stringifyYaml } from 'yaml';
-import { getBaseBranch } from './git.js';
+import { getBaseBranch, readHeadBranch } from './git.js';
 
 /**
  * Locked branch patterns - branches that should never have planning dirs.
@@ -35,13 +35,16 @@ const LOCKED_BRANCH_NAMES = new Set([
 
 const LOCKED_BRANCH_PREFIXES = ['wt-', 'quick/'];
 
+/** Characters that are not safe in a planning directory name */
+const UNSAFE_DIR_CHARS = /[^a-zA-Z0-9_-]/g;
+
 /**
  * Sanitize a branch name for use as a directory name.
  * Converts slashes and other non-safe characters to hyphens.
  * Example: feature/foo-bar → feature-foo-bar
  */
 export function sanitizeBranchForDir(branch: string): string {
-  return branch.replace(/[^a-zA-Z0-9_-]/g, '-');
+  return branch.replace(UNSAFE_DIR_CHARS, '-');
 }
 
 /**
@@ -119,11 +122,19 @@ export interface DecisionEntry {
 
 /**
  * Get the current git branch name
+ * Reads HEAD directly when possible; falls back to `rev-parse --abbrev-ref`
+ * (detached HEAD, reftable repos, GIT_DIR overrides).
  */
 export function getCurrentBranch(cwd?: string): string {
+  const workDir = cwd || process.cwd();
+  const headBranch = readHeadBranch(workDir);
+  if (headBranch !== null) {
+    return headBranch;
+  }
+
   try {
     const branch = execSync('git rev-parse --abbrev-ref HEAD', {
-      cwd: cwd || process.cwd(),
+      cwd: workDir,
       encoding: 'utf-8',
       stdio: ['pipe', 'pipe', 'pipe'],
     }).trim();
@@ -133,16 +144,26 @@ export function getCurrentBranch(cwd?: string): string {
   }
 }
 
+/** Resolved git roots keyed by working directory (stable for the process lifetime) */
+const gitRootCache = new Map<string, string>();
+
 /**
  * Get the root of the git repository
  */
 export function getGitRoot(cwd?: string): string {
+  const workDir = cwd || process.cwd();
+  const cached = gitRootCache.get(workDir);
+  if (cached) {
+    return cached;
+  }
+
   try {
     const root = execSync('git rev-parse --show-toplevel', {
-      cwd: cwd || process.cwd(),
+      cwd: workDir,
       encoding: 'utf-8',
       stdio: ['pipe', 'pipe', 'pipe'],
     }).trim();
+    gitRootCache.set(workDir, root);
     return root;
   } catch {
     return process.cwd();
@@ -190,23 +211,47 @@ export function planningDirExists(key: string, cwd?: string): boolean {
 }
 
 /**
- * Read the status file for a key
+ * Parsed status.yaml cache keyed by absolute path.
+ * Entries are invalidated by mtime/size, so long-lived processes (TUI, event loop)
+ * skip re-reading and re-parsing unchanged status files on every poll.
  */
-export function readStatus(key: string, cwd?: string): StatusFile | null {
-  const paths = getPlanningPaths(key, cwd);
+const statusCache = new Map<string, { mtimeMs: number; size: number; status: StatusFile }>();
 
-  if (!existsSync(paths.status)) {
+/**
+ * Read and parse a status.yaml file, reusing the cached parse when unchanged.
+ * Returns a copy so callers can mutate the result freely.
+ */
+export function readStatusFile(statusPath: string): StatusFile | null {
+  const stat = statSync(statusPath, { throwIfNoEntry: false });
+  if (!stat) {
+    statusCache.delete(statusPath);
     return null;
   }
 
+  const cached = statusCache.get(statusPath);
+  if (cached && cached.mtimeMs === stat.mtimeMs && cached.size === stat.size) {
+    return structuredClone(cached.status);
+  }
+
   try {
-    const content = readFileSync(paths.status, 'utf-8');
-    return parseYaml(content) as StatusFile;
+    const content = readFileSync(statusPath, 'utf-8');
+    const status = parseYaml(content) as StatusFile;
+    statusCache.set(statusPath, { mtimeMs: stat.mtimeMs, size: stat.size, status });
+    return structuredClone(status);
   } catch {
+    statusCache.delete(statusPath);
     return null;
   }
 }
 
+/**
+ * Read the status file for a key
+ */
+export function readStatus(key: string, cwd?: string): StatusFile | null {
+  const paths = getPlanningPaths(key, cwd);
+  return readStatusFile(paths.status);
+}
+
 /**
  * Check if a branch matches the status file's original branch.
  * Returns true if they match or if no branch is stored (backwards compatibility).
@@ -243,6 +288,7 @@ export function writeStatus(status: StatusFile, key: string, cwd?: string): void
 
   const content = stringifyYaml(status);
   writeFileSync(paths.status, content);
+  statusCache.delete(paths.status);
 }
 
 /**
@@ -558,48 +604,58 @@ export interface PlanningInfo {
   isCurrent: boolean;
 }
 
+export interface PlanningStatusEntry {
+  /** Directory key (sanitized branch name) */
+  key: string;
+  /** Parsed status.yaml */
+  status: StatusFile;
+}
+
 /**
- * List all planning directories
+ * Scan .planning/ once and return every planning directory with its parsed status.
+ * Hidden directories and directories without a readable status.yaml are skipped.
  */
-export function listPlanningDirs(cwd?: string): PlanningInfo[] {
-  const gitRoot = getGitRoot(cwd);
-  const planningRoot = join(gitRoot, '.planning');
+export function scanPlanningStatuses(cwd?: string): PlanningStatusEntry[] {
+  const planningRoot = join(getGitRoot(cwd), '.planning');
 
-  if (!existsSync(planningRoot)) {
+  let entries: Dirent[];
+  try {
+    entries = readdirSync(planningRoot, { withFileTypes: true });
+  } catch {
     return [];
   }
 
-  const currentBranch = getCurrentBranch(cwd);
-  const currentKey = sanitizeBranchForDir(currentBranch);
-  const entries = readdirSync(planningRoot, { withFileTypes: true });
-  const dirs: PlanningInfo[] = [];
-
+  const results: PlanningStatusEntry[] = [];
   for (const entry of entries) {
     // Skip non-directories and hidden files
     if (!entry.isDirectory() || entry.name.startsWith('.')) {
       continue;
     }
 
-    const statusPath = join(planningRoot, entry.name, 'status.yaml');
-    if (!existsSync(statusPath)) {
-      continue;
+    const status = readStatusFile(join(planningRoot, entry.name, 'status.yaml'));
+    if (status) {
+      results.push({ key: entry.name, status });
     }
+  }
 
-    try {
-      const content = readFileSync(statusPath, 'utf-8');
-      const status = parseYaml(content) as StatusFile;
-
-      dirs.push({
-        key: entry.name,
-        specPath: status.spec,
-        stage: status.stage,
-        isCurrent: entry.name === currentKey,
-      });
-    } catch {
-      // Skip malformed status files
-      continue;
-    }
+  return results;
+}
+
+/**
+ * List all planning directories
+ */
+export function listPlanningDirs(cwd?: string): PlanningInfo[] {
+  const statuses = scanPlanningStatuses(cwd);
+  if (statuses.length === 0) {
+    return [];
   }
 
-  return dirs;
+  const currentKey = sanitizeBranchForDir(getCurrentBranch(cwd));
+
+  return statuses.map(({ key, status }) => ({
+    key,
+    specPath: status.spec,
+    stage: status.stage,
+    isCurrent: key === currentKey,
+  }));
 }
@@ -455,7 +455,9 @@ export function queryDaemonSync(
       return null;
     }
 
-    const response = JSON.parse(result.stdout.trim()) as DaemonResponse;
+    // JSON.parse tolerates surrounding whitespace, so parse stdout as-is
+    // rather than copying it through trim() first
+    const response = JSON.parse(result.stdout) as DaemonResponse;
 
     // Check if daemon is indexing
     if (response.indexing) {
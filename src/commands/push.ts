@@ -1,16 +1,26 @@
-import { copyFileSync, existsSync, mkdirSync, readFileSync, rmSync } from 'fs';
+import { existsSync, mkdirSync, readFileSync, rmSync, statSync, writeFileSync } from 'fs';
+import { createHash } from 'crypto';
 import { tmpdir } from 'os';
-import { dirname, join } from 'path';
-import { minimatch } from 'minimatch';
+import { join } from 'path';
+import { Minimatch } from 'minimatch';
 import * as readline from 'readline';
-import { git, isGitRepo, getGitFiles, getFileBlobHash, fileExistsInHistory } from '../lib/git.js';
-import { checkGhAuth, checkGhInstalled, getGhUser, gh } from '../lib/gh.js';
-import { Manifest, filesAreDifferent } from '../lib/manifest.js';
+import { git, isGitRepo, getGitFiles, getFileBlobHashes, filesExistInHistory } from '../lib/git.js';
+import { checkGhAuth, checkGhInstalled, getGhUser, gh, repoExists } from '../lib/gh.js';
+import { Manifest, filesAreDifferentAsync } from '../lib/manifest.js';
+import { copyFileInto, mapLimit } from '../lib/fs-utils.js';
 import { getAllhandsRoot, UPSTREAM_REPO } from '../lib/paths.js';
 import { askQuestion, confirm } from '../lib/ui.js';
-import { PUSH_BLOCKLIST, SYNC_CONFIG_FILENAME } from '../lib/constants.js';
+import { PATHSPEC_CHUNK_SIZE, PUSH_BLOCKLIST, PUSH_DIGEST_FILENAME, SYNC_CONFIG_FILENAME } from '../lib/constants.js';
 import { readSyncState, wasModifiedSinceSync, SyncState } from '../lib/sync-state.js';
 
+// Set form of the blocklist for constant-time lookups in the per-file filters
+const PUSH_BLOCKLIST_SET = new Set(PUSH_BLOCKLIST);
+
+// Upper bound on file comparisons in flight at once
+const COMPARE_CONCURRENCY = 16;
+// Upper bound on file copies into the temporary clone in flight at once
+const COPY_CONCURRENCY = 8;
+
 interface SyncConfig {
   includes?: string[];
   excludes?: string[];
@@ -39,9 +49,9 @@ function loadSyncConfig(cwd: string): SyncConfig | null {
   }
 }
 
-function expandGlob(pattern: string, baseDir: string): string[] {
-  const allFiles = getGitFiles(baseDir);
-  return allFiles.filter((relPath) => minimatch(relPath, pattern, { dot: true }));
+function expandGlob(pattern: string, allFiles: string[]): string[] {
+  const matcher = new Minimatch(pattern, { dot: true });
+  return allFiles.filter((relPath) => matcher.match(relPath));
 }
 
 async function askMultiLineInput(prompt: string): Promise<string> {
@@ -70,13 +80,16 @@ async function askMultiLineInput(prompt: string): Promise<string> {
   });
 }
 
-function checkPrerequisites(cwd: string): PrerequisiteResult {
+async function checkPrerequisites(cwd: string): Promise<PrerequisiteResult> {
   if (!checkGhInstalled()) {
     console.error('Error: gh CLI required. Install: https://cli.github.com');
     return { success: false };
   }
 
-  if (!checkGhAuth()) {
+  // Auth status and user lookup are independent network round-trips; overlap them
+  const [authed, ghUser] = await Promise.all([checkGhAuth(), getGhUser()]);
+
+  if (!authed) {
     console.error('Error: Not authenticated. Run: gh auth login');
     return { success: false };
   }
@@ -86,7 +99,6 @@ function checkPrerequisites(cwd: string): PrerequisiteResult {
     return { success: false };
   }
 
-  const ghUser = getGhUser();
   if (!ghUser) {
     console.error('Error: Could not determine GitHub username');
     return { success: false };
@@ -96,48 +108,81 @@ function checkPrerequisites(cwd: string): PrerequisiteResult {
 }
 
 /**
- * Determine if a file was actually modified by the target repo,
+ * Determine which files were actually modified by the target repo,
  * vs simply being out of date because upstream moved forward.
  *
  * Prefers the sync-state manifest (written during sync) which records the
  * exact blob hash of each source file at sync time. Falls back to git
  * history search for repos synced before the manifest existed.
+ *
+ * Blob hashes are computed in one `git hash-object --stdin-paths` batch per
+ * repo rather than one fork per file.
  */
-function wasModifiedByTargetRepo(
+function filterModifiedByTargetRepo(
   cwd: string,
-  relPath: string,
+  relPaths: string[],
   allhandsRoot: string,
   syncState: SyncState | null
-): boolean {
-  const localFile = join(cwd, relPath);
+): Set<string> {
+  const modified = new Set<string>();
+  const legacyPaths: string[] = [];
 
   // Prefer manifest check when available
-  if (syncState) {
-    const manifestResult = wasModifiedSinceSync(localFile, relPath, syncState, cwd);
-    if (manifestResult !== null) return manifestResult;
+  const manifestFiles = syncState?.files ?? {};
+  const trackedPaths = relPaths.filter((relPath) => manifestFiles[relPath]);
+  const localHashes = getFileBlobHashes(trackedPaths.map((relPath) => join(cwd, relPath)), cwd);
+  for (const relPath of relPaths) {
+    const manifestResult = syncState
+      ? wasModifiedSinceSync(localHashes.get(join(cwd, relPath)), relPath, syncState)
+      : null;
+    if (manifestResult === null) {
+      legacyPaths.push(relPath);
+    } else if (manifestResult) {
+      modified.add(relPath);
+    }
   }
 
   // Fall back to git history for legacy repos or files not in manifest
-  const localBlobHash = getFileBlobHash(localFile, allhandsRoot);
+  const legacyHashes = getFileBlobHashes(legacyPaths.map((relPath) => join(cwd, relPath)), allhandsRoot);
+  const localBlobHashes = new Map<string, string>();
+  for (const relPath of legacyPaths) {
+    const localBlobHash = legacyHashes.get(join(cwd, relPath));
+    if (localBlobHash) {
+      localBlobHashes.set(relPath, localBlobHash);
+    } else {
+      modified.add(relPath); // safe default: assume modified on error
+    }
+  }
 
-  if (!localBlobHash) return true; // safe default: assume modified on error
+  const inHistory = filesExistInHistory(localBlobHashes, allhandsRoot);
+  for (const relPath of localBlobHashes.keys()) {
+    if (!inHistory.has(relPath)) {
+      modified.add(relPath);
+    }
+  }
 
-  return !fileExistsInHistory(relPath, localBlobHash, allhandsRoot);
+  return modified;
 }
 
-function collectFilesToPush(
+async function collectFilesToPush(
   cwd: string,
   finalIncludes: string[],
   finalExcludes: string[]
-): FileEntry[] {
+): Promise<FileEntry[]> {
   const allhandsRoot = getAllhandsRoot();
   const manifest = new Manifest(allhandsRoot);
   const upstreamFiles = manifest.getDistributableFiles();
   const syncState = readSyncState(cwd);
+  const excludeMatchers = finalExcludes.map((pattern) => new Minimatch(pattern, { dot: true }));
+  const isExcluded = (relPath: string) => excludeMatchers.some((matcher) => matcher.match(relPath));
   const filesToPush: FileEntry[] = [];
+  // Local files present on both sides; compared concurrently after filtering
+  const comparePaths: string[] = [];
 
-  // Get non-ignored files in user's repo (respects .gitignore)
-  const localGitFiles = new Set(getGitFiles(cwd));
+  // Get non-ignored files in user's repo (respects .gitignore); listed once and
+  // reused for include-pattern expansion
+  const localGitFileList = getGitFiles(cwd);
+  const localGitFiles = new Set(localGitFileList);
 
   // Get files deleted locally (both staged and unstaged deletions)
   const deletedFiles = new Set<string>();
@@ -155,10 +200,10 @@ function collectFilesToPush(
     if (manifest.isInitOnly(relPath)) {
       continue;
     }
-    if (PUSH_BLOCKLIST.includes(relPath)) {
+    if (PUSH_BLOCKLIST_SET.has(relPath)) {
       continue;
     }
-    if (finalExcludes.some((pattern) => minimatch(relPath, pattern, { dot: true }))) {
+    if (isExcluded(relPath)) {
       continue;
     }
     // Skip files that are gitignored in user's repo (but allow deleted files through)
@@ -166,48 +211,85 @@ function collectFilesToPush(
       continue;
     }
 
-    const localFile = join(cwd, relPath);
-    const upstreamFile = join(allhandsRoot, relPath);
-
-    if (existsSync(localFile)) {
-      if (filesAreDifferent(localFile, upstreamFile)) {
-        if (wasModifiedByTargetRepo(cwd, relPath, allhandsRoot, syncState)) {
-          filesToPush.push({ path: relPath, type: 'M' });
-        }
-      }
+    if (existsSync(join(cwd, relPath))) {
+      comparePaths.push(relPath);
     } else if (deletedFiles.has(relPath)) {
       filesToPush.push({ path: relPath, type: 'D' });
     }
   }
 
+  const differs = await mapLimit(comparePaths, COMPARE_CONCURRENCY, (relPath) =>
+    filesAreDifferentAsync(join(cwd, relPath), join(allhandsRoot, relPath))
+  );
+  // Local files that differ from upstream; checked for target-repo edits in one batch
+  const changedPaths = comparePaths.filter((_, i) => differs[i]);
+
+  for (const relPath of filterModifiedByTargetRepo(cwd, changedPaths, allhandsRoot, syncState)) {
+    filesToPush.push({ path: relPath, type: 'M' });
+  }
+
+  // Paths already queued, so include patterns don't rescan filesToPush per match
+  const queuedPaths = new Set(filesToPush.map((f) => f.path));
+  const includePaths = new Set<string>();
   for (const pattern of finalIncludes) {
-    const matchedFiles = expandGlob(pattern, cwd);
+    const matchedFiles = expandGlob(pattern, localGitFileList);
     for (const relPath of matchedFiles) {
+      if (queuedPaths.has(relPath) || includePaths.has(relPath)) continue;
       if (manifest.isInitOnly(relPath)) continue;
-      if (PUSH_BLOCKLIST.includes(relPath)) continue;
-      if (finalExcludes.some((p) => minimatch(relPath, p, { dot: true }))) continue;
-      if (filesToPush.some((f) => f.path === relPath)) continue;
-
-      const localFile = join(cwd, relPath);
-      const upstreamFile = join(allhandsRoot, relPath);
+      if (PUSH_BLOCKLIST_SET.has(relPath)) continue;
+      if (isExcluded(relPath)) continue;
 
-      // Skip files that exist in upstream and are identical
-      if (existsSync(upstreamFile) && !filesAreDifferent(localFile, upstreamFile)) {
-        continue;
-      }
+      includePaths.add(relPath);
+    }
+  }
 
+  // Skip files that exist in upstream and are identical
+  // (a missing upstream file is reported as different, so no separate existence stat)
+  const includeList = [...includePaths];
+  const includeDiffers = await mapLimit(includeList, COMPARE_CONCURRENCY, (relPath) =>
+    filesAreDifferentAsync(join(cwd, relPath), join(allhandsRoot, relPath))
+  );
+  includeList.forEach((relPath, i) => {
+    if (includeDiffers[i]) {
       filesToPush.push({ path: relPath, type: 'A' });
     }
-  }
+  });
 
   return filesToPush;
 }
 
+/**
+ * Fingerprint the set of files a push would send: path, change type, size and mtime.
+ * Content is not read; any edit moves the mtime, which is enough to detect a repeat.
+ */
+function computePushDigest(cwd: string, filesToPush: FileEntry[]): string {
+  const hash = createHash('sha256');
+  for (const file of [...filesToPush].sort((a, b) => a.path.localeCompare(b.path))) {
+    const stat = file.type === 'D' ? null : statSync(join(cwd, file.path), { throwIfNoEntry: false });
+    hash.update(`${file.type}\0${file.path}\0${stat?.size ?? -1}\0${stat?.mtimeMs ?? -1}\n`);
+  }
+  return hash.digest('hex');
+}
+
+function getPushDigestPath(cwd: string): string | null {
+  const result = git(['rev-parse', '--absolute-git-dir'], cwd);
+  return result.success ? join(result.stdout, PUSH_DIGEST_FILENAME) : null;
+}
+
+function readPushDigest(digestPath: string | null): string | null {
+  if (!digestPath || !existsSync(digestPath)) return null;
+  try {
+    return readFileSync(digestPath, 'utf-8').trim();
+  } catch {
+    return null;
+  }
+}
+
 async function waitForFork(ghUser: string, repoName: string): Promise<boolean> {
   console.log('Waiting for fork to be ready...');
   for (let i = 0; i < 15; i++) {
     await new Promise((r) => setTimeout(r, 2000));
-    if (gh(['repo', 'view', `${ghUser}/${repoName}`, '--json', 'name']).success) {
+    if (await repoExists(`${ghUser}/${repoName}`)) {
       return true;
     }
   }
@@ -222,9 +304,7 @@ async function createPullRequest(
   body: string
 ): Promise<number> {
   const repoName = UPSTREAM_REPO.split('/')[1];
-  const forkCheck = gh(['repo', 'view', `${ghUser}/${repoName}`, '--json', 'name']);
-
-  if (!forkCheck.success) {
+  if (!(await repoExists(`${ghUser}/${repoName}`))) {
     console.log('Creating fork...');
     const forkResult = gh(['repo', 'fork', UPSTREAM_REPO, '--clone=false']);
     if (!forkResult.success) {
@@ -248,14 +328,10 @@ async function createPullRequest(
       return 1;
     }
 
+    // Fetch upstream main by URL straight into FETCH_HEAD; the throwaway clone
+    // never needs a named remote, which saves a git invocation
     console.log('Fetching upstream...');
-    const addRemoteResult = git(['remote', 'add', 'upstream', `https://github.com/${UPSTREAM_REPO}`], tempDir);
-    if (!addRemoteResult.success) {
-      console.error('Error adding upstream remote:', addRemoteResult.stderr);
-      return 1;
-    }
-
-    const fetchResult = git(['fetch', 'upstream', 'main', '--depth=1'], tempDir);
+    const fetchResult = git(['fetch', '--depth=1', `https://github.com/${UPSTREAM_REPO}`, 'main'], tempDir, { discardStdout: true });
     if (!fetchResult.success) {
       console.error('Error fetching upstream:', fetchResult.stderr);
       return 1;
@@ -264,38 +340,69 @@ async function createPullRequest(
     const branchName = `contrib/${ghUser}/${Date.now()}`;
     console.log(`Creating branch: ${branchName}`);
 
-    const checkoutResult = git(['checkout', '-b', branchName, 'upstream/main'], tempDir);
+    const checkoutResult = git(['checkout', '-b', branchName, 'FETCH_HEAD'], tempDir, { discardStdout: true });
     if (!checkoutResult.success) {
       console.error('Error creating branch:', checkoutResult.stderr);
       return 1;
     }
 
     console.log('Applying changes...');
+    const deletedPaths: string[] = [];
+    const copiedPaths: string[] = [];
     for (const file of filesToPush) {
       if (file.type === 'D') {
-        git(['rm', '--ignore-unmatch', file.path], tempDir);
+        deletedPaths.push(file.path);
       } else {
-        const src = join(cwd, file.path);
-        const dest = join(tempDir, file.path);
-        mkdirSync(dirname(dest), { recursive: true });
-        copyFileSync(src, dest);
+        copiedPaths.push(file.path);
       }
     }
 
-    const addResult = git(['add', '.'], tempDir);
-    if (!addResult.success) {
-      console.error('Error staging files:', addResult.stderr);
-      return 1;
+    // Copies are independent, so run them concurrently; staging stays sequential below
+    await mapLimit(copiedPaths, COPY_CONCURRENCY, (relPath) =>
+      copyFileInto(join(cwd, relPath), join(tempDir, relPath))
+    );
+
+    // Stage exactly the touched paths rather than rescanning the whole clone with `git add .`;
+    // literal pathspecs keep names like `[id].ts` from being treated as globs
+    for (let i = 0; i < deletedPaths.length; i += PATHSPEC_CHUNK_SIZE) {
+      const chunk = deletedPaths.slice(i, i + PATHSPEC_CHUNK_SIZE);
+      git(['--literal-pathspecs', 'rm', '--ignore-unmatch', '--', ...chunk], tempDir, { discardStdout: true });
+    }
+
+    // Explicitly naming an ignored path makes `git add` fail, so filter those out up front
+    // with a single check-ignore call; exit status 1 just means nothing matched.
+    // -z keeps non-ASCII names from being C-quoted in the output
+    let pathsToAdd = copiedPaths;
+    if (copiedPaths.length > 0) {
+      const ignoreResult = git(['check-ignore', '-z', '--stdin'], tempDir, { input: copiedPaths.join('\0') + '\0' });
+      if (ignoreResult.success && ignoreResult.stdout) {
+        const ignored = new Set(ignoreResult.stdout.split('\0').filter(Boolean));
+        console.log(`Skipping ${ignored.size} file(s) ignored by the upstream .gitignore:`);
+        for (const path of ignored) {
+          console.log(`  ${path}`);
+        }
+        pathsToAdd = copiedPaths.filter((relPath) => !ignored.has(relPath));
+      }
     }
 
+    for (let i = 0; i < pathsToAdd.length; i += PATHSPEC_CHUNK_SIZE) {
+      const chunk = pathsToAdd.slice(i, i + PATHSPEC_CHUNK_SIZE);
+      const addResult = git(['--literal-pathspecs', 'add', '--', ...chunk], tempDir, { discardStdout: true });
+      if (!addResult.success) {
+        console.error('Error staging files:', addResult.stderr);
+        return 1;
+      }
+    }
+
+    // Keep stdout here: `git commit` reports failures such as "nothing to commit" there
     const commitResult = git(['commit', '-m', title], tempDir);
     if (!commitResult.success) {
-      console.error('Error committing:', commitResult.stderr);
+      console.error('Error committing:', commitResult.stderr || commitResult.stdout);
       return 1;
     }
 
     console.log('Pushing to fork...');
-    const pushResult = git(['push', '-u', 'origin', branchName], tempDir);
+    const pushResult = git(['push', '-u', 'origin', branchName], tempDir, { discardStdout: true });
     if (!pushResult.success) {
       console.error('Error pushing:', pushResult.stderr);
       return 1;
@@ -334,11 +441,12 @@ export async function cmdPush(
   exclude: string[],
   dryRun: boolean,
   titleArg?: string,
-  bodyArg?: string
+  bodyArg?: string,
+  force: boolean = false
 ): Promise<number> {
   const cwd = process.cwd();
 
-  const prereqs = checkPrerequisites(cwd);
+  const prereqs = await checkPrerequisites(cwd);
   if (!prereqs.success) {
     return 1;
   }
@@ -354,7 +462,7 @@ export async function cmdPush(
   const finalIncludes = include.length > 0 ? include : (syncConfig?.includes || []);
   const finalExcludes = exclude.length > 0 ? exclude : (syncConfig?.excludes || []);
 
-  const filesToPush = collectFilesToPush(cwd, finalIncludes, finalExcludes);
+  const filesToPush = await collectFilesToPush(cwd, finalIncludes, finalExcludes);
 
   if (filesToPush.length === 0) {
     console.log('No changes to push');
@@ -374,6 +482,14 @@ export async function cmdPush(
     return 0;
   }
 
+  // Skip the clone/commit/PR pipeline when nothing changed since the last successful push
+  const digestPath = getPushDigestPath(cwd);
+  const digest = computePushDigest(cwd, filesToPush);
+  if (!force && readPushDigest(digestPath) === digest) {
+    console.log('No changes since last push (use --force to create another PR)');
+    return 0;
+  }
+
   const title = titleArg || await askQuestion('PR title: ');
   if (!title.trim()) {
     console.error('Error: Title cannot be empty');
@@ -394,5 +510,13 @@ export async function cmdPush(
 
   console.log(`\nUsing GitHub account: ${ghUser}`);
 
-  return createPullRequest(cwd, ghUser, filesToPush, title, body);
+  const code = await createPullRequest(cwd, ghUser, filesToPush, title, body);
+  if (code === 0 && digestPath) {
+    try {
+      writeFileSync(digestPath, digest + '\n');
+    } catch {
+      // Digest is only an optimization; ignore write failures
+    }
+  }
+  return code;
 }
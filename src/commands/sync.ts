@@ -1,14 +1,18 @@
-import { copyFileSync, existsSync, mkdirSync, readFileSync, unlinkSync, writeFileSync } from 'fs';
+import { existsSync, mkdirSync, readFileSync, writeFileSync } from 'fs';
 import { homedir } from 'os';
 import { basename, dirname, join, resolve } from 'path';
 import { isGitRepo, getStagedFiles } from '../lib/git.js';
-import { Manifest, filesAreDifferent } from '../lib/manifest.js';
+import { Manifest, filesAreDifferentAsync } from '../lib/manifest.js';
 import { getAllhandsRoot } from '../lib/paths.js';
 import { ConflictResolution, askConflictResolution, confirm, getNextBackupPath } from '../lib/ui.js';
 import { SYNC_CONFIG_FILENAME, SYNC_CONFIG_TEMPLATE } from '../lib/constants.js';
 import { restoreDotfiles } from '../lib/dotfiles.js';
 import { ensureTargetLines } from '../lib/target-lines.js';
 import { writeSyncState } from '../lib/sync-state.js';
+import { copyFile, listExistingPaths, mapLimit } from '../lib/fs-utils.js';
+
+// Upper bound on source/target comparisons in flight at once
+const COMPARE_CONCURRENCY = 16;
 
 const AH_SHIM_SCRIPT = `#!/bin/bash
 # AllHands CLI shim - finds and executes project-local .allhands/harness/ah
@@ -84,14 +88,16 @@ export async function cmdSync(target: string = '.', autoYes: boolean = false, in
     }
   }
 
+  // Load manifest once; the full distributable set is used for the staged check
+  // and then narrowed for file-by-file sync
+  const manifest = new Manifest(allhandsRoot);
+  const distributable = manifest.getDistributableFiles();
+
   // Update-only: Check for staged changes to managed files
   if (!isFirstTime) {
-    const manifest = new Manifest(allhandsRoot);
-    const distributable = manifest.getDistributableFiles();
     const staged = getStagedFiles(resolvedTarget);
-    const managedPaths = new Set(distributable);
 
-    const stagedConflicts = [...staged].filter(f => managedPaths.has(f));
+    const stagedConflicts = [...staged].filter(f => distributable.has(f));
     if (stagedConflicts.length > 0) {
       console.error('Error: Staged changes detected in managed files:');
       for (const f of stagedConflicts.sort()) {
@@ -102,10 +108,6 @@ export async function cmdSync(target: string = '.', autoYes: boolean = false, in
     }
   }
 
-  // Load manifest for file-by-file sync
-  const manifest = new Manifest(allhandsRoot);
-  const distributable = manifest.getDistributableFiles();
-
   // Filter out init-only files when --init is not set
   if (!init) {
     for (const relPath of [...distributable]) {
@@ -120,27 +122,33 @@ export async function cmdSync(target: string = '.', autoYes: boolean = false, in
   let skipped = 0;
   let resolution: ConflictResolution = 'overwrite';
   const conflicts: string[] = [];
-  const deletedInSource: string[] = [];
+  // Classification from the detection pass, reused by the copy pass so each
+  // source/target pair is only compared once
+  const unchanged = new Set<string>();
+  // One directory listing per parent dir rather than a stat per file. The source
+  // side needs no check: distributable was just produced by walking allhandsRoot
+  const existingInTarget = listExistingPaths(resolvedTarget, distributable);
 
-  // Detect conflicts and deleted files
-  for (const relPath of distributable) {
-    const sourceFile = join(allhandsRoot, relPath);
-    const targetFile = join(resolvedTarget, relPath);
+  // Files present on both sides; compared concurrently after classification
+  const comparePaths: string[] = [];
 
-    if (!existsSync(sourceFile)) {
-      // Update-only: track deleted files
-      if (!isFirstTime && existsSync(targetFile)) {
-        deletedInSource.push(relPath);
-      }
-      continue;
+  // Detect conflicts
+  for (const relPath of distributable) {
+    if (existingInTarget.has(relPath)) {
+      comparePaths.push(relPath);
     }
+  }
 
-    if (existsSync(targetFile)) {
-      if (filesAreDifferent(sourceFile, targetFile)) {
-        conflicts.push(relPath);
-      }
+  const differs = await mapLimit(comparePaths, COMPARE_CONCURRENCY, (relPath) =>
+    filesAreDifferentAsync(join(allhandsRoot, relPath), join(resolvedTarget, relPath))
+  );
+  comparePaths.forEach((relPath, i) => {
+    if (differs[i]) {
+      conflicts.push(relPath);
+    } else {
+      unchanged.add(relPath);
     }
-  }
+  });
 
   // Handle conflicts
   if (conflicts.length > 0) {
@@ -160,7 +168,7 @@ export async function cmdSync(target: string = '.', autoYes: boolean = false, in
       for (const relPath of conflicts) {
         const targetFile = join(resolvedTarget, relPath);
         const bkPath = getNextBackupPath(targetFile);
-        copyFileSync(targetFile, bkPath);
+        copyFile(targetFile, bkPath);
         console.log(`  ${relPath} → ${basename(bkPath)}`);
       }
     }
@@ -171,26 +179,25 @@ export async function cmdSync(target: string = '.', autoYes: boolean = false, in
   console.log(`Found ${distributable.size} files to distribute`);
 
   const syncedFiles = new Set<string>();
+  const conflictSet = new Set(conflicts);
 
   for (const relPath of [...distributable].sort()) {
-    const sourceFile = join(allhandsRoot, relPath);
-    const targetFile = join(resolvedTarget, relPath);
+    syncedFiles.add(relPath);
 
-    if (!existsSync(sourceFile)) continue;
+    if (unchanged.has(relPath)) {
+      skipped++;
+      continue;
+    }
 
-    syncedFiles.add(relPath);
+    const sourceFile = join(allhandsRoot, relPath);
+    const targetFile = join(resolvedTarget, relPath);
 
     mkdirSync(dirname(targetFile), { recursive: true });
+    copyFile(sourceFile, targetFile);
 
-    if (existsSync(targetFile)) {
-      if (!filesAreDifferent(sourceFile, targetFile)) {
-        skipped++;
-        continue;
-      }
-      copyFileSync(sourceFile, targetFile);
+    if (conflictSet.has(relPath)) {
       copied++;
     } else {
-      copyFileSync(sourceFile, targetFile);
       created++;
     }
   }
@@ -201,24 +208,6 @@ export async function cmdSync(target: string = '.', autoYes: boolean = false, in
   // Write sync-state manifest for push false-positive detection
   writeSyncState(resolvedTarget, allhandsRoot, syncedFiles);
 
-  // Update-only: Handle deleted files
-  if (!isFirstTime && deletedInSource.length > 0) {
-    console.log(`\n${deletedInSource.length} files removed from allhands source:`);
-    for (const f of deletedInSource) {
-      console.log(`  - ${f}`);
-    }
-    const shouldDelete = autoYes || (await confirm('Delete these from target?'));
-    if (shouldDelete) {
-      for (const f of deletedInSource) {
-        const targetFile = join(resolvedTarget, f);
-        if (existsSync(targetFile)) {
-          unlinkSync(targetFile);
-          console.log(`  Deleted: ${f}`);
-        }
-      }
-    }
-  }
-
   // Ensure target files have required lines (CLAUDE.md, .gitignore, .tldrignore)
   console.log('\nSyncing target-lines...');
   const targetLinesUpdated = ensureTargetLines(resolvedTarget, true);
@@ -231,7 +220,7 @@ export async function cmdSync(target: string = '.', autoYes: boolean = false, in
 
     if (existsSync(sourceEnv)) {
       console.log(`Copying ${envExample}`);
-      copyFileSync(sourceEnv, targetEnv);
+      copyFile(sourceEnv, targetEnv);
     }
   }
 
@@ -1,5 +1,10 @@
 export const SYNC_CONFIG_FILENAME = '.allhands-sync-config.json';
 export const SYNC_STATE_FILENAME = '.allhands/.sync-state.json';
+// Stored inside the target repo's git dir so it is never committed
+export const PUSH_DIGEST_FILENAME = 'allhands-push-digest';
+
+// Paths per git invocation that takes a pathspec list, keeping the argument list well under ARG_MAX
+export const PATHSPEC_CHUNK_SIZE = 1000;
 
 // Files that should never be pushed back to upstream
 export const PUSH_BLOCKLIST = ['CLAUDE.project.md', '.allhands-sync-config.json', '.allhands/.sync-state.json'];
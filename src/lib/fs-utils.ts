@@ -1,5 +1,6 @@
-import { existsSync, readdirSync } from 'fs';
-import { join } from 'path';
+import { constants, copyFileSync, existsSync, readdirSync } from 'fs';
+import { copyFile as copyFileAsync, mkdir } from 'fs/promises';
+import { dirname, join } from 'path';
 
 export function walkDir(dir: string, callback: (filePath: string) => void): void {
   if (!existsSync(dir)) return;
@@ -16,3 +17,73 @@ export function walkDir(dir: string, callback: (filePath: string) => void): void
     }
   }
 }
+
+/**
+ * Copy file contents without preserving timestamps.
+ * Uses a copy-on-write clone where the filesystem supports it (APFS, btrfs, XFS)
+ * and falls back to a regular kernel-side copy otherwise.
+ */
+export function copyFile(src: string, dest: string): void {
+  copyFileSync(src, dest, constants.COPYFILE_FICLONE);
+}
+
+/**
+ * Async counterpart of copyFile that also creates the destination's parent
+ * directory, for copying many files concurrently.
+ */
+export async function copyFileInto(src: string, dest: string): Promise<void> {
+  await mkdir(dirname(dest), { recursive: true });
+  await copyFileAsync(src, dest, constants.COPYFILE_FICLONE);
+}
+
+/**
+ * Resolve which of the given root-relative paths exist under root.
+ * Lists each distinct parent directory once instead of stat-ing every file,
+ * which keeps large syncs to one readdir per directory. A name missing from
+ * its listing is confirmed with existsSync, since case- or normalization-
+ * insensitive filesystems (default APFS) can hold it under a different spelling.
+ */
+export function listExistingPaths(root: string, relPaths: Iterable<string>): Set<string> {
+  const dirEntries = new Map<string, Set<string> | null>();
+  const existing = new Set<string>();
+
+  for (const relPath of relPaths) {
+    const dir = dirname(relPath);
+    let names = dirEntries.get(dir);
+    if (names === undefined) {
+      try {
+        names = new Set(readdirSync(join(root, dir)));
+      } catch {
+        names = null;
+      }
+      dirEntries.set(dir, names);
+    }
+    if (!names) {
+      continue; // Parent directory is missing, so the file is too
+    }
+    if (names.has(relPath.slice(dir === '.' ? 0 : dir.length + 1)) || existsSync(join(root, relPath))) {
+      existing.add(relPath);
+    }
+  }
+
+  return existing;
+}
+
+/**
+ * Map items through an async function with at most `limit` calls in flight.
+ * Results keep the input order.
+ */
+export async function mapLimit<T, R>(items: T[], limit: number, fn: (item: T) => Promise<R>): Promise<R[]> {
+  const results = new Array<R>(items.length);
+  let next = 0;
+
+  const worker = async (): Promise<void> => {
+    while (next < items.length) {
+      const i = next++;
+      results[i] = await fn(items[i]);
+    }
+  };
+
+  await Promise.all(Array.from({ length: Math.min(limit, items.length) }, worker));
+  return results;
+}
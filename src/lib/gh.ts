@@ -1,4 +1,4 @@
-import { execSync, spawnSync } from 'child_process';
+import { execSync, spawn, spawnSync } from 'child_process';
 
 export interface GhResult {
   success: boolean;
@@ -20,6 +20,28 @@ export function gh(args: string[], cwd?: string): GhResult {
   };
 }
 
+/**
+ * Non-blocking variant of gh() so independent network calls can overlap.
+ */
+export function ghAsync(args: string[], cwd?: string): Promise<GhResult> {
+  return new Promise((resolve) => {
+    const child = spawn('gh', args, { cwd: cwd || process.cwd() });
+    const stdout: Buffer[] = [];
+    const stderr: Buffer[] = [];
+
+    child.stdout.on('data', (chunk: Buffer) => stdout.push(chunk));
+    child.stderr.on('data', (chunk: Buffer) => stderr.push(chunk));
+    child.on('error', (e) => resolve({ success: false, stdout: '', stderr: e.message }));
+    child.on('close', (code) => {
+      resolve({
+        success: code === 0,
+        stdout: Buffer.concat(stdout).toString('utf-8').trim(),
+        stderr: Buffer.concat(stderr).toString('utf-8').trim(),
+      });
+    });
+  });
+}
+
 export function checkGhInstalled(): boolean {
   try {
     execSync('gh --version', { stdio: 'ignore' });
@@ -29,12 +51,44 @@ export function checkGhInstalled(): boolean {
   }
 }
 
-export function checkGhAuth(): boolean {
-  const result = gh(['auth', 'status']);
+export async function checkGhAuth(): Promise<boolean> {
+  const result = await ghAsync(['auth', 'status']);
   return result.success;
 }
 
-export function getGhUser(): string | null {
-  const result = gh(['api', 'user', '-q', '.login']);
+export async function getGhUser(): Promise<string | null> {
+  const result = await ghAsync(['api', 'user', '-q', '.login']);
   return result.success ? result.stdout : null;
 }
+
+// Global fetch emits an ExperimentalWarning before Node 20, so only use it from there on
+const HAS_STABLE_FETCH = Number(process.versions.node.split('.')[0]) >= 20;
+
+/**
+ * Check whether a GitHub repo (owner/name) exists and is visible.
+ * With GH_TOKEN or GITHUB_TOKEN set (checked in gh's own order, so the probe runs as
+ * the same identity as later gh calls) this is a single REST HEAD request, avoiding a
+ * gh process start and config load; otherwise (or on older Node, or on network error)
+ * falls back to gh.
+ */
+export async function repoExists(fullName: string): Promise<boolean> {
+  const token = process.env.GH_TOKEN || process.env.GITHUB_TOKEN;
+  if (token && HAS_STABLE_FETCH) {
+    try {
+      const res = await fetch(`https://api.github.com/repos/${fullName}`, {
+        method: 'HEAD',
+        headers: {
+          Authorization: `Bearer ${token}`,
+          Accept: 'application/vnd.github+json',
+        },
+      });
+      if (res.ok) return true;
+      if (res.status === 404) return false;
+    } catch {
+      // Fall through to gh
+    }
+  }
+
+  const result = await ghAsync(['repo', 'view', fullName, '--json', 'name']);
+  return result.success;
+}
@@ -1,4 +1,5 @@
 import { execSync, spawnSync } from 'child_process';
+import { PATHSPEC_CHUNK_SIZE } from './constants.js';
 
 export interface GitResult {
   success: boolean;
@@ -6,9 +7,18 @@ export interface GitResult {
   stderr: string;
 }
 
-export function git(args: string[], cwd: string): GitResult {
+export interface GitOptions {
+  /** Data written to git's stdin */
+  input?: string;
+  /** Send stdout to /dev/null for commands whose output is never read */
+  discardStdout?: boolean;
+}
+
+export function git(args: string[], cwd: string, options: GitOptions = {}): GitResult {
   const result = spawnSync('git', args, {
     cwd,
+    input: options.input,
+    stdio: ['pipe', options.discardStdout ? 'ignore' : 'pipe', 'pipe'],
     encoding: 'utf-8',
     maxBuffer: 10 * 1024 * 1024,
   });
@@ -70,6 +80,32 @@ export function getFileBlobHash(filePath: string, repoPath: string): string | nu
   return result.success ? result.stdout.trim() : null;
 }
 
+/**
+ * Compute git blob hashes for many files with a single `git hash-object --stdin-paths`
+ * process instead of one fork per file. Returns a map of file path to hash; files that
+ * could not be hashed are omitted.
+ */
+export function getFileBlobHashes(filePaths: string[], repoPath: string): Map<string, string> {
+  const hashes = new Map<string, string>();
+  if (filePaths.length === 0) return hashes;
+
+  const result = git(['hash-object', '--stdin-paths'], repoPath, {
+    input: filePaths.join('\n') + '\n',
+  });
+  const lines = result.stdout.split('\n');
+  if (result.success && lines.length === filePaths.length) {
+    filePaths.forEach((filePath, i) => hashes.set(filePath, lines[i]));
+    return hashes;
+  }
+
+  // Batch aborts on the first unreadable path; fall back to per-file hashing
+  for (const filePath of filePaths) {
+    const hash = getFileBlobHash(filePath, repoPath);
+    if (hash) hashes.set(filePath, hash);
+  }
+  return hashes;
+}
+
 /**
  * Get the HEAD commit hash of a repo. Returns null if no commits exist.
  */
@@ -91,8 +127,53 @@ export function hasUncommittedChanges(repoPath: string): boolean {
  * Uses a single `rev-list --objects` call instead of per-commit lookups.
  */
 export function fileExistsInHistory(relPath: string, blobHash: string, repoPath: string): boolean {
-  const result = git(['rev-list', 'HEAD', '--objects', '--', relPath], repoPath);
+  const result = git(['--literal-pathspecs', 'rev-list', 'HEAD', '--objects', '--', relPath], repoPath);
   if (!result.success || !result.stdout) return false;
 
   return result.stdout.split('\n').some(line => line.startsWith(blobHash + ' '));
 }
+
+/**
+ * Batch form of fileExistsInHistory: one `rev-list --objects` walk per chunk of paths.
+ * Takes a map of relative path to blob hash and returns the paths whose hash appears
+ * in their own history. A chunk whose walk fails (e.g. output beyond maxBuffer) is
+ * re-checked file by file rather than reported as absent.
+ */
+export function filesExistInHistory(blobHashes: Map<string, string>, repoPath: string): Set<string> {
+  const found = new Set<string>();
+  const entries = [...blobHashes];
+
+  for (let i = 0; i < entries.length; i += PATHSPEC_CHUNK_SIZE) {
+    const chunk = entries.slice(i, i + PATHSPEC_CHUNK_SIZE);
+    const relPaths = chunk.map(([relPath]) => relPath);
+    const result = git(['--literal-pathspecs', 'rev-list', 'HEAD', '--objects', '--', ...relPaths], repoPath);
+    if (!result.success) {
+      for (const [relPath, blobHash] of chunk) {
+        if (fileExistsInHistory(relPath, blobHash, repoPath)) {
+          found.add(relPath);
+        }
+      }
+      continue;
+    }
+
+    // rev-list lists each object once, under the first path it was reached by
+    const objectPaths = new Map<string, string>();
+    for (const line of result.stdout.split('\n')) {
+      const space = line.indexOf(' ');
+      if (space !== -1) {
+        objectPaths.set(line.slice(0, space), line.slice(space + 1));
+      }
+    }
+
+    for (const [relPath, blobHash] of chunk) {
+      const seenAt = objectPaths.get(blobHash);
+      if (seenAt === relPath) {
+        found.add(relPath);
+      } else if (seenAt !== undefined && fileExistsInHistory(relPath, blobHash, repoPath)) {
+        // Same content was reached via another path first; confirm against this path alone
+        found.add(relPath);
+      }
+    }
+  }
+  return found;
+}
@@ -1,12 +1,13 @@
 import { existsSync, readFileSync } from 'fs';
 import { join, relative, dirname } from 'path';
-import { minimatch } from 'minimatch';
+import { Minimatch } from 'minimatch';
 import { walkDir } from './fs-utils.js';
 
 interface GitignoreRule {
   pattern: string;
   negated: boolean;
   directory: string; // Directory where the .gitignore lives (relative to root)
+  matchers: Minimatch[]; // Precompiled pattern and its `/**` directory form
 }
 
 /**
@@ -39,29 +40,17 @@ function parseGitignoreFile(content: string, directory: string): GitignoreRule[]
     // Skip empty patterns after processing
     if (!pattern) continue;
 
-    rules.push({ pattern, negated, directory });
+    rules.push({ pattern, negated, directory, matchers: compilePattern(pattern) });
   }
 
   return rules;
 }
 
 /**
- * Check if a file path matches a gitignore pattern.
- * Handles directory-relative patterns correctly.
+ * Compile a gitignore pattern into minimatch matchers.
+ * Done once per rule so matching a file does not recompile every pattern.
  */
-function matchesPattern(filePath: string, rule: GitignoreRule): boolean {
-  const { pattern, directory } = rule;
-
-  // Get the path relative to the gitignore's directory
-  let relativePath = filePath;
-  if (directory) {
-    if (!filePath.startsWith(directory + '/') && filePath !== directory) {
-      // File is not under this gitignore's directory
-      return false;
-    }
-    relativePath = filePath.slice(directory.length + 1);
-  }
-
+function compilePattern(pattern: string): Minimatch[] {
   // Handle patterns that should only match from root of gitignore dir
   let matchPattern = pattern;
 
@@ -84,19 +73,30 @@ function matchesPattern(filePath: string, rule: GitignoreRule): boolean {
     matchPattern = '**/' + matchPattern;
   }
 
-  // Try matching
   const opts = { dot: true, matchBase: false };
 
-  if (minimatch(relativePath, matchPattern, opts)) {
-    return true;
-  }
+  // Also match with ** suffix for directories
+  return [new Minimatch(matchPattern, opts), new Minimatch(matchPattern + '/**', opts)];
+}
+
+/**
+ * Check if a file path matches a gitignore pattern.
+ * Handles directory-relative patterns correctly.
+ */
+function matchesPattern(filePath: string, rule: GitignoreRule): boolean {
+  const { directory } = rule;
 
-  // Also try with ** suffix for directories
-  if (minimatch(relativePath, matchPattern + '/**', opts)) {
-    return true;
+  // Get the path relative to the gitignore's directory
+  let relativePath = filePath;
+  if (directory) {
+    if (!filePath.startsWith(directory + '/') && filePath !== directory) {
+      // File is not under this gitignore's directory
+      return false;
+    }
+    relativePath = filePath.slice(directory.length + 1);
   }
 
-  return false;
+  return rule.matchers.some((matcher) => matcher.match(relativePath));
 }
 
 /**
@@ -105,6 +105,7 @@ function matchesPattern(filePath: string, rule: GitignoreRule): boolean {
 export class GitignoreFilter {
   private rules: GitignoreRule[] = [];
   private rootDir: string;
+  private files: string[] = []; // Every file seen by the walk, relative to root
 
   constructor(rootDir: string) {
     this.rootDir = rootDir;
@@ -112,7 +113,8 @@ export class GitignoreFilter {
   }
 
   /**
-   * Walk the directory tree and load all .gitignore files.
+   * Walk the directory tree once, loading all .gitignore files and recording
+   * every file so getNonIgnoredFiles does not need a second walk.
    */
   private loadGitignoreFiles(): void {
     // Check root .gitignore
@@ -125,6 +127,7 @@ export class GitignoreFilter {
     // Walk and find nested .gitignore files
     walkDir(this.rootDir, (filePath) => {
       const relativePath = relative(this.rootDir, filePath);
+      this.files.push(relativePath);
       if (relativePath.endsWith('.gitignore') && relativePath !== '.gitignore') {
         const content = readFileSync(filePath, 'utf-8');
         const directory = dirname(relativePath);
@@ -150,18 +153,9 @@ export class GitignoreFilter {
   }
 
   /**
-   * Get all non-ignored files from the directory tree.
+   * Get all non-ignored files from the directory tree (as walked at construction).
    */
   getNonIgnoredFiles(): string[] {
-    const files: string[] = [];
-
-    walkDir(this.rootDir, (filePath) => {
-      const relativePath = relative(this.rootDir, filePath);
-      if (!this.isIgnored(relativePath)) {
-        files.push(relativePath);
-      }
-    });
-
-    return files;
+    return this.files.filter((relativePath) => !this.isIgnored(relativePath));
   }
 }
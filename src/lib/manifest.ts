@@ -1,6 +1,7 @@
-import { readFileSync, existsSync, statSync } from 'fs';
+import { existsSync, readFileSync } from 'fs';
+import { open, stat } from 'fs/promises';
 import { join } from 'path';
-import { minimatch, Minimatch } from 'minimatch';
+import { Minimatch } from 'minimatch';
 import { GitignoreFilter } from './gitignore.js';
 
 interface InternalData {
@@ -15,6 +16,7 @@ export class Manifest {
   private internalPath: string;
   private data: InternalData;
   private gitignoreFilter: GitignoreFilter;
+  private internalMatchers: Minimatch[];
   private initOnlyMatchers: { matcher: Minimatch; negated: boolean }[];
 
   constructor(allhandsRoot: string) {
@@ -22,6 +24,7 @@ export class Manifest {
     this.internalPath = join(allhandsRoot, INTERNAL_FILENAME);
     this.data = this.load();
     this.gitignoreFilter = new GitignoreFilter(allhandsRoot);
+    this.internalMatchers = this.internalPatterns.map(p => new Minimatch(p, { dot: true }));
     this.initOnlyMatchers = this.initOnlyPatterns.map(p => {
       const negated = p.startsWith('!');
       const pattern = negated ? p.slice(1) : p;
@@ -49,7 +52,7 @@ export class Manifest {
    * Check if a file is marked as internal (should not be distributed).
    */
   isInternal(path: string): boolean {
-    return this.internalPatterns.some(pattern => minimatch(path, pattern, { dot: true }));
+    return this.internalMatchers.some(matcher => matcher.match(path));
   }
 
   /**
@@ -99,23 +102,48 @@ export class Manifest {
   }
 }
 
+const COMPARE_CHUNK_SIZE = 64 * 1024;
+
 /**
  * Compare two files byte-by-byte.
+ * Sizes are checked first; equal-sized files are read in fixed-size chunks so memory
+ * stays bounded and the comparison stops at the first differing chunk. Async with
+ * per-call buffers so many pairs can be compared concurrently.
  */
-export function filesAreDifferent(file1: string, file2: string): boolean {
-  if (!existsSync(file1) || !existsSync(file2)) {
+export async function filesAreDifferentAsync(file1: string, file2: string): Promise<boolean> {
+  // One stat per file covers both existence and the size short-circuit
+  const [stat1, stat2] = await Promise.all([
+    stat(file1).catch(() => null),
+    stat(file2).catch(() => null),
+  ]);
+
+  if (!stat1 || !stat2 || stat1.size !== stat2.size) {
     return true;
   }
-
-  const stat1 = statSync(file1);
-  const stat2 = statSync(file2);
-
-  if (stat1.size !== stat2.size) {
-    return true;
+  // Same inode (hard link or the same path) is identical without reading
+  if (stat1.ino === stat2.ino && stat1.dev === stat2.dev) {
+    return false;
   }
 
-  const content1 = readFileSync(file1);
-  const content2 = readFileSync(file2);
-
-  return !content1.equals(content2);
+  const buf1 = Buffer.allocUnsafe(COMPARE_CHUNK_SIZE);
+  const buf2 = Buffer.allocUnsafe(COMPARE_CHUNK_SIZE);
+  const fh1 = await open(file1, 'r');
+  try {
+    const fh2 = await open(file2, 'r');
+    try {
+      while (true) {
+        const [{ bytesRead: read1 }, { bytesRead: read2 }] = await Promise.all([
+          fh1.read(buf1, 0, COMPARE_CHUNK_SIZE, null),
+          fh2.read(buf2, 0, COMPARE_CHUNK_SIZE, null),
+        ]);
+        if (read1 !== read2) return true;
+        if (read1 === 0) return false;
+        if (buf1.compare(buf2, 0, read2, 0, read1) !== 0) return true;
+      }
+    } finally {
+      await fh2.close();
+    }
+  } finally {
+    await fh1.close();
+  }
 }
@@ -5,9 +5,25 @@ import { fileURLToPath } from 'url';
 export const UPSTREAM_REPO = 'kalem-edlin/all-hands';
 export const UPSTREAM_OWNER = 'kalem-edlin';
 
+// Resolved root keyed by the ALLHANDS_PATH it was resolved under
+let cachedRoot: { envPath: string | undefined; root: string } | null = null;
+
+/**
+ * Locate the allhands package root. The result is memoized (per ALLHANDS_PATH
+ * value) since sync resolves it from several places in one run.
+ */
 export function getAllhandsRoot(): string {
-  // 1. Check ALLHANDS_PATH env var (for local dev testing)
   const envPath = process.env.ALLHANDS_PATH;
+  if (cachedRoot && cachedRoot.envPath === envPath) {
+    return cachedRoot.root;
+  }
+  const root = resolveAllhandsRoot(envPath);
+  cachedRoot = { envPath, root };
+  return root;
+}
+
+function resolveAllhandsRoot(envPath: string | undefined): string {
+  // 1. Check ALLHANDS_PATH env var (for local dev testing)
   if (envPath) {
     const resolved = resolve(envPath);
     if (existsSync(resolved) && existsSync(resolve(resolved, '.internal.json'))) {
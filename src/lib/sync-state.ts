@@ -1,6 +1,6 @@
 import { existsSync, mkdirSync, readFileSync, writeFileSync } from 'fs';
 import { dirname, join } from 'path';
-import { getFileBlobHash } from './git.js';
+import { getFileBlobHashes } from './git.js';
 import { getHeadCommit, hasUncommittedChanges } from './git.js';
 import { SYNC_STATE_FILENAME } from './constants.js';
 
@@ -23,11 +23,11 @@ export function writeSyncState(
   syncedFiles: Set<string>
 ): void {
   const files: Record<string, string> = {};
+  const relPaths = [...syncedFiles].sort().filter((relPath) => existsSync(join(allhandsRoot, relPath)));
+  const hashes = getFileBlobHashes(relPaths.map((relPath) => join(allhandsRoot, relPath)), allhandsRoot);
 
-  for (const relPath of [...syncedFiles].sort()) {
-    const sourceFile = join(allhandsRoot, relPath);
-    if (!existsSync(sourceFile)) continue;
-    const hash = getFileBlobHash(sourceFile, allhandsRoot);
+  for (const relPath of relPaths) {
+    const hash = hashes.get(join(allhandsRoot, relPath));
     if (hash) {
       files[relPath] = hash;
     }
@@ -72,21 +72,20 @@ export function readSyncState(targetRoot: string): SyncState | null {
 }
 
 /**
- * Check whether a target file was modified since the last sync.
+ * Check whether a target file was modified since the last sync, given the
+ * target's current blob hash (batch-computed by the caller).
  * Returns null if the file is not in the manifest (caller should fall back).
  * Returns true if the target's hash differs from the manifest.
  * Returns false if the target's hash matches the manifest.
  */
 export function wasModifiedSinceSync(
-  targetFilePath: string,
+  targetHash: string | undefined,
   relPath: string,
-  syncState: SyncState,
-  repoPath: string
+  syncState: SyncState
 ): boolean | null {
   const manifestHash = syncState.files[relPath];
   if (!manifestHash) return null;
 
-  const targetHash = getFileBlobHash(targetFilePath, repoPath);
   if (!targetHash) return true; // safe default: assume modified on error
 
   return targetHash !== manifestHash;
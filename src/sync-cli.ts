@@ -94,6 +94,12 @@ async function main() {
             alias: 'b',
             type: 'string',
             describe: 'PR body (skips prompt)',
+          })
+          .option('force', {
+            alias: 'f',
+            type: 'boolean',
+            describe: 'Create a PR even if nothing changed since the last push',
+            default: false,
           });
       },
       async (argv) => {
@@ -102,7 +108,8 @@ async function main() {
           argv.exclude as string[],
           argv.dryRun as boolean,
           argv.title as string | undefined,
-          argv.body as string | undefined
+          argv.body as string | undefined,
+          argv.force as boolean
         );
         process.exit(code);
       }